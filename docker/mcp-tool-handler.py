@@ -14,12 +14,43 @@ import os
 import sys
 import json
 import time
+import random
+import hashlib
 import logging
+import socket
+import selectors
 import subprocess
 import threading
+import functools
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, NamedTuple, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    
+    def _json_dumps_canonical(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    # Fall back to the standard library when orjson is not installed
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    
+    def _json_dumps_canonical(obj: Any) -> bytes:
+        # Same bytes orjson produces with OPT_SORT_KEYS
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+try:
+    import fastjsonschema
+except ImportError:
+    # Input validation is skipped when fastjsonschema is not installed
+    fastjsonschema = None
 
 # Configure logging
 logging.basicConfig(
@@ -35,10 +66,103 @@ AUTH_TOKEN = os.environ.get("MCP_TOOL_AUTH_TOKEN", "default-dev-token")
 TOOL_PORT = int(os.environ.get("MCP_TOOL_PORT", "8082"))
 REVIT_HOST = os.environ.get("REVIT_HOST", "localhost")
 REVIT_PORT = int(os.environ.get("REVIT_PORT", "5000"))
+MAX_CONCURRENCY = int(os.environ.get("MCP_TOOL_MAX_CONCURRENCY", "16"))
+
+# Timeouts (seconds) for outbound HTTP calls
+CONNECT_TIMEOUT = 2.0
+REGISTRY_READ_TIMEOUT = float(os.environ.get("MCP_REGISTRY_READ_TIMEOUT", "30"))
+REVIT_READ_TIMEOUT = float(os.environ.get("REVIT_READ_TIMEOUT", "30"))
+# Dynamo scripts can run for a long time, so their read is unbounded unless configured
+DYNAMO_READ_TIMEOUT = float(os.environ["REVIT_DYNAMO_READ_TIMEOUT"]) if os.environ.get("REVIT_DYNAMO_READ_TIMEOUT") else None
 
 # Path to tool schema definitions
 SCHEMA_DIR = "/app/schemas"
 
+@functools.lru_cache(maxsize=64)
+def _read_schema(path: str) -> Dict[str, Any]:
+    """Read and parse a tool schema file (cached, schemas are static)"""
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+def _response_excerpt(response: requests.Response, limit: int = 512) -> str:
+    """Decode the start of a response body for error messages, skipping requests' charset detection"""
+    return response.content[:limit].decode("utf-8", "replace")
+
+# Default for an omitted input, by JSON schema type
+_DEFAULT_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "string": str,
+    "object": dict,
+    "array": list,
+    "boolean": bool,
+    "integer": int,
+    "number": float,
+}
+
+def _schema_default_factory(prop: Any) -> Optional[Callable[[], Any]]:
+    """Default factory for a schema property's type, or None if the type is not usable"""
+    schema_type = prop.get("type") if isinstance(prop, dict) else None
+    if isinstance(schema_type, list):
+        # Union types such as ["string", "null"]: use the first non-null member
+        schema_type = next((t for t in schema_type if t != "null"), None)
+    if not isinstance(schema_type, str):
+        return None
+    return _DEFAULT_FACTORIES.get(schema_type)
+
+def _make_request_builder(
+    fields: Dict[str, Tuple[str, Optional[Callable[[], Any]]]],
+    input_schema: Dict[str, Any],
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Specialize a tool's input -> Revit parameter mapping against its input schema"""
+    properties = input_schema.get("properties", {})
+    plan = tuple(
+        (src, dst, default or _schema_default_factory(properties.get(src)) or (lambda: None))
+        for src, (dst, default) in fields.items()
+    )
+    
+    def build_req(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {dst: inputs[src] if src in inputs else default() for src, dst, default in plan}
+    
+    return build_req
+
+def _wrap_result(data: Any) -> Any:
+    """Pass Revit data through as the MCP result"""
+    return data
+
+def _wrap_script_results(data: Any) -> Dict[str, Any]:
+    """Wrap Dynamo script output in the MCP result shape"""
+    return {
+        "success": True,
+        "results": data,
+    }
+
+class ToolSpec(NamedTuple):
+    """How an MCP tool maps onto the Revit MCP Server"""
+    endpoint_path: str
+    action: str
+    # MCP input name -> (Revit parameter name, default factory when the input is omitted;
+    # None falls back to the input schema's type)
+    fields: Dict[str, Tuple[str, Optional[Callable[[], Any]]]]
+    build_resp: Callable[[Any], Any]
+    read_timeout: Optional[float]  # None waits for Revit indefinitely
+
+# Tool name -> Revit endpoint and request/response translation
+TOOL_DISPATCH: Dict[str, ToolSpec] = {
+    "revit_element_query": ToolSpec(
+        endpoint_path="/api/element/mcp",
+        action="getElementsByCategory",
+        fields={"category": ("category", str), "filter": ("filterExpression", str)},
+        build_resp=_wrap_result,
+        read_timeout=REVIT_READ_TIMEOUT,
+    ),
+    "revit_dynamo_execute": ToolSpec(
+        endpoint_path="/api/dynamo/mcp",
+        action="runDynamoScript",
+        fields={"script_path": ("scriptPath", str), "parameters": ("scriptParameters", dict)},
+        build_resp=_wrap_script_results,
+        read_timeout=DYNAMO_READ_TIMEOUT,
+    ),
+}
+
 class RevitMcpToolHandler:
     """Handler for Revit MCP Tool requests"""
     
@@ -46,16 +170,76 @@ class RevitMcpToolHandler:
         self.tool_schemas = self._load_tool_schemas()
         self.revit_server_process = None
         
+        # Per-tool request builders, specialized once against the loaded input schemas
+        self._request_builders = {
+            tool_name: _make_request_builder(
+                spec.fields,
+                self.tool_schemas.get(tool_name, {}).get("input_schema", {}),
+            )
+            for tool_name, spec in TOOL_DISPATCH.items()
+        }
+        
+        # Input validators, compiled once per tool
+        self.input_validators = self._compile_input_validators()
+        
+        # Full input/output schemas served on demand, serialized once up front
+        self._schema_payloads = {
+            tool_name: _json_dumps({
+                "input_schema": schema.get("input_schema", {}),
+                "output_schema": schema.get("output_schema", {}),
+            })
+            for tool_name, schema in self.tool_schemas.items()
+        }
+        
+        # Shared connection pool so calls to Revit and the registry reuse keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Bounds how many tool requests are in flight against Revit at once
+        self.executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY, thread_name_prefix="revit-request")
+        
+        # Registry URL and auth header, built once
+        self._registry_url = f"{REGISTRY_URL}/v1/tools"
+        self._registry_headers = {"Authorization": f"Bearer {AUTH_TOKEN}"}
+        self._registry_batch_url = f"{REGISTRY_URL}/v1/tools:batch"
+        self._registry_json_headers = {**self._registry_headers, "Content-Type": "application/json"}
+        
+        # Compression only costs CPU when Revit is on the loopback interface
+        self._revit_headers = {"Content-Type": "application/json"}
+        if REVIT_HOST in ("localhost", "127.0.0.1", "::1"):
+            self._revit_headers["Accept-Encoding"] = "identity"
+        
+        # Revit MCP Server endpoint per tool
+        self._endpoints = {
+            tool_name: f"http://{REVIT_HOST}:{REVIT_PORT}{spec.endpoint_path}"
+            for tool_name, spec in TOOL_DISPATCH.items()
+        }
+        
     def _load_tool_schemas(self) -> Dict[str, Dict[str, Any]]:
         """Load tool schemas from JSON files"""
         schemas = {}
-        for filename in os.listdir(SCHEMA_DIR):
-            if filename.endswith(".json"):
-                tool_name = filename.split(".")[0]
-                with open(os.path.join(SCHEMA_DIR, filename), "r") as f:
-                    schemas[tool_name] = json.load(f)
+        with os.scandir(SCHEMA_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    tool_name = entry.name[:-len(".json")]
+                    schemas[tool_name] = _read_schema(entry.path)
         return schemas
     
+    def _compile_input_validators(self) -> Dict[str, Callable[[Any], Any]]:
+        """Compile a validator for each tool's input schema"""
+        if fastjsonschema is None:
+            logger.warning("fastjsonschema is not installed, tool inputs will not be validated")
+            return {}
+        
+        # Compiling also rejects malformed schemas at startup
+        return {
+            tool_name: fastjsonschema.compile(schema["input_schema"])
+            for tool_name, schema in self.tool_schemas.items()
+            if "input_schema" in schema
+        }
+    
     def start_revit_server(self):
         """Start the Revit MCP Server as a subprocess"""
         logger.info("Starting Revit MCP Server...")
@@ -76,94 +260,160 @@ class RevitMcpToolHandler:
         self._wait_for_server_ready()
         
     def _monitor_process_output(self, process):
-        """Monitor and log the process output"""
-        for line in iter(process.stdout.readline, b''):
-            logger.info(f"RevitServer: {line.decode().strip()}")
-        for line in iter(process.stderr.readline, b''):
-            logger.error(f"RevitServer: {line.decode().strip()}")
+        """Monitor and log the process output (stdout at INFO, stderr at ERROR)"""
+        # Drain both pipes from one loop so a full stderr pipe can never block the child
+        selector = selectors.DefaultSelector()
+        selector.register(process.stdout, selectors.EVENT_READ, (logging.INFO, bytearray()))
+        selector.register(process.stderr, selectors.EVENT_READ, (logging.ERROR, bytearray()))
+        
+        while selector.get_map():
+            for key, _ in selector.select():
+                level, pending = key.data
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    if pending and logger.isEnabledFor(level):
+                        logger.log(level, "RevitServer: %s", pending.decode(errors='replace').strip())
+                    continue
+                
+                pending += chunk
+                *lines, rest = pending.split(b"\n")
+                if logger.isEnabledFor(level):
+                    for line in lines:
+                        logger.log(level, "RevitServer: %s", line.decode(errors='replace').strip())
+                pending[:] = rest
+        
+        selector.close()
     
-    def _wait_for_server_ready(self, max_retries=30, retry_interval=1):
-        """Wait for the Revit MCP Server to be ready"""
-        logger.info(f"Waiting for Revit MCP Server at http://{REVIT_HOST}:{REVIT_PORT}...")
+    def _wait_for_server_ready(self, timeout=30, base_delay=0.05, max_delay=2.0):
+        """Wait for the Revit MCP Server to be ready (exponential backoff with full jitter)"""
+        logger.info("Waiting for Revit MCP Server at http://%s:%s...", REVIT_HOST, REVIT_PORT)
         
-        for _ in range(max_retries):
+        status_url = f"http://{REVIT_HOST}:{REVIT_PORT}/api/status"
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        
+        while True:
             try:
-                response = requests.get(f"http://{REVIT_HOST}:{REVIT_PORT}/api/status")
+                response = self.session.get(status_url, timeout=(1.0, 2.0))
                 if response.status_code == 200:
                     logger.info("Revit MCP Server is ready")
                     return
-            except requests.exceptions.ConnectionError:
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
                 pass
             
-            time.sleep(retry_interval)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            time.sleep(min(delay, remaining))
+            attempt += 1
         
-        logger.error(f"Revit MCP Server not ready after {max_retries * retry_interval} seconds")
+        logger.error("Revit MCP Server not ready after %s seconds", timeout)
         raise RuntimeError("Failed to connect to Revit MCP Server")
     
+    def _registration_data(self, tool_name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the registry summary for a tool"""
+        return {
+            "id": f"{TOOL_ID}.{tool_name}",
+            "name": schema.get("name", tool_name),
+            "description": schema.get("description", ""),
+            "version": schema.get("version", "1.0.0"),
+            "endpoint": f"http://revit-mcp-tool:{TOOL_PORT}/tools/{tool_name}",
+            "schema_url": f"http://revit-mcp-tool:{TOOL_PORT}/schemas/{tool_name}",
+        }
+    
     def register_tools(self):
         """Register tools with the MCP registry"""
-        logger.info(f"Registering tools with MCP registry at {REGISTRY_URL}...")
+        logger.info("Registering tools with MCP registry at %s...", REGISTRY_URL)
         
-        for tool_name, schema in self.tool_schemas.items():
-            tool_id = f"{TOOL_ID}.{tool_name}"
+        registrations = [
+            self._registration_data(tool_name, schema)
+            for tool_name, schema in sorted(self.tool_schemas.items())
+        ]
+        
+        # Register everything in one round trip when the registry supports it
+        try:
+            response = self._post_to_registry(self._registry_batch_url, {"tools": registrations})
             
-            registration_data = {
-                "id": tool_id,
-                "name": schema.get("name", tool_name),
-                "description": schema.get("description", ""),
-                "version": schema.get("version", "1.0.0"),
-                "input_schema": schema.get("input_schema", {}),
-                "output_schema": schema.get("output_schema", {}),
-                "endpoint": f"http://revit-mcp-tool:{TOOL_PORT}/tools/{tool_name}",
-            }
+            if response.status_code in (200, 201):
+                logger.info("Successfully registered %d tools", len(registrations))
+                return
+            if response.status_code == 409:
+                # Some tools may already exist; per-tool registration is idempotent and treats 409 as done
+                logger.warning("Batch registration conflicted, registering tools individually")
+            elif response.status_code in (404, 405):
+                logger.info("Registry has no batch endpoint, registering tools individually")
+            else:
+                logger.error("Failed to register tools: %s - %s", response.status_code, _response_excerpt(response))
+                return
+        except Exception as e:
+            logger.error("Error registering tools: %s", e)
+            return
+        
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix="revit-register") as pool:
+            futures = [pool.submit(self._register_one, registration_data) for registration_data in registrations]
+            for future in as_completed(futures):
+                future.result()
+    
+    def _register_one(self, registration_data: Dict[str, Any]):
+        """Register a single tool with the MCP registry"""
+        tool_id = registration_data["id"]
+        
+        try:
+            response = self._post_to_registry(self._registry_url, registration_data)
             
+            if response.status_code in (200, 201, 409):
+                logger.info("Successfully registered tool: %s", tool_id)
+            else:
+                logger.error("Failed to register tool %s: %s - %s", tool_id, response.status_code, _response_excerpt(response))
+        except Exception as e:
+            logger.error("Error registering tool %s: %s", tool_id, e)
+    
+    def _post_to_registry(self, url: str, payload: Any, max_attempts=5, base_delay=0.1, max_delay=2.0) -> requests.Response:
+        """POST to the registry with an idempotency key, retrying transient failures with jittered backoff"""
+        # Canonical serialization, so the same registration hashes the same across restarts
+        body = _json_dumps_canonical(payload)
+        headers = {
+            **self._registry_json_headers,
+            "Idempotency-Key": hashlib.blake2b(body, digest_size=8).hexdigest(),
+        }
+        
+        for attempt in range(max_attempts):
+            last_attempt = attempt == max_attempts - 1
             try:
-                response = requests.post(
-                    f"{REGISTRY_URL}/v1/tools",
-                    json=registration_data,
-                    headers={"Authorization": f"Bearer {AUTH_TOKEN}"},
-                )
-                
-                if response.status_code in (200, 201):
-                    logger.info(f"Successfully registered tool: {tool_id}")
-                else:
-                    logger.error(f"Failed to register tool {tool_id}: {response.status_code} - {response.text}")
-            except Exception as e:
-                logger.error(f"Error registering tool {tool_id}: {str(e)}")
+                response = self.session.post(url, data=body, headers=headers, timeout=(CONNECT_TIMEOUT, REGISTRY_READ_TIMEOUT))
+                retryable = response.status_code == 429 or response.status_code >= 500
+                if not retryable or last_attempt:
+                    return response
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if last_attempt:
+                    raise
+            
+            time.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** attempt)))
+    
+    def get_tool_schema(self, tool_name: str) -> Optional[bytes]:
+        """Return the serialized input/output schemas for a tool, or None if unknown"""
+        return self._schema_payloads.get(tool_name)
     
     def translate_mcp_to_revit(self, tool_name: str, mcp_request: Dict[str, Any]) -> Dict[str, Any]:
         """Translate MCP request to Revit MCP Server format"""
-        if tool_name == "revit_element_query":
-            # Map MCP inputs to Revit MCP Server request
-            category = mcp_request.get("inputs", {}).get("category", "")
-            filter_expr = mcp_request.get("inputs", {}).get("filter", "")
-            
-            return {
-                "action": "getElementsByCategory",
-                "parameters": {
-                    "category": category,
-                    "filterExpression": filter_expr,
-                }
-            }
-        
-        elif tool_name == "revit_dynamo_execute":
-            # Map MCP inputs to Revit MCP Server request
-            script_path = mcp_request.get("inputs", {}).get("script_path", "")
-            parameters = mcp_request.get("inputs", {}).get("parameters", {})
-            
-            return {
-                "action": "runDynamoScript",
-                "parameters": {
-                    "scriptPath": script_path,
-                    "scriptParameters": parameters,
-                }
-            }
-        
-        else:
+        spec = TOOL_DISPATCH.get(tool_name)
+        if spec is None:
             raise ValueError(f"Unknown tool: {tool_name}")
+        
+        return {
+            "action": spec.action,
+            "parameters": self._request_builders[tool_name](mcp_request.get("inputs") or {}),
+        }
     
     def translate_revit_to_mcp(self, tool_name: str, revit_response: Dict[str, Any]) -> Dict[str, Any]:
         """Translate Revit MCP Server response to MCP format"""
+        spec = TOOL_DISPATCH.get(tool_name)
+        if spec is None:
+            raise ValueError(f"Unknown tool: {tool_name}")
+        
         if revit_response.get("status") == "error":
             return {
                 "status": "error",
@@ -171,61 +421,61 @@ class RevitMcpToolHandler:
             }
         
         # Extract the actual data from the Revit response
-        data = revit_response.get("data", {})
+        return {
+            "status": "success",
+            "result": spec.build_resp(revit_response.get("data", {})),
+        }
+    
+    def handle_tool_request(self, tool_name: str, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle an incoming MCP tool request"""
+        logger.info("Handling request for tool: %s", tool_name)
         
-        if tool_name == "revit_element_query":
+        if tool_name not in TOOL_DISPATCH:
             return {
-                "status": "success",
-                "result": data,
+                "status": "error",
+                "error": f"Unknown tool: {tool_name}",
             }
         
-        elif tool_name == "revit_dynamo_execute":
+        if not isinstance(request_data, dict):
             return {
-                "status": "success",
-                "result": {
-                    "success": True,
-                    "results": data,
-                }
+                "status": "error",
+                "error": "Request body must be a JSON object",
             }
         
-        else:
-            raise ValueError(f"Unknown tool: {tool_name}")
-    
-    def handle_tool_request(self, tool_name: str, request_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle an incoming MCP tool request"""
-        logger.info(f"Handling request for tool: {tool_name}")
-        
         try:
+            validate = self.input_validators.get(tool_name)
+            if validate is not None:
+                try:
+                    validate(request_data.get("inputs") or {})
+                except fastjsonschema.JsonSchemaValueException as e:
+                    return {
+                        "status": "error",
+                        "error": f"Invalid inputs for {tool_name}: {e.message}",
+                    }
+            
             # Translate MCP request to Revit format
             revit_request = self.translate_mcp_to_revit(tool_name, request_data)
             
-            # Determine endpoint based on tool
-            if tool_name == "revit_element_query":
-                endpoint = f"http://{REVIT_HOST}:{REVIT_PORT}/api/element/mcp"
-            elif tool_name == "revit_dynamo_execute":
-                endpoint = f"http://{REVIT_HOST}:{REVIT_PORT}/api/dynamo/mcp"
-            else:
-                raise ValueError(f"Unknown tool: {tool_name}")
-            
             # Send request to Revit MCP Server
-            response = requests.post(
-                endpoint,
+            response = self.session.post(
+                self._endpoints[tool_name],
                 json=revit_request,
-                headers={"Content-Type": "application/json"},
+                headers=self._revit_headers,
+                timeout=(CONNECT_TIMEOUT, TOOL_DISPATCH[tool_name].read_timeout),
             )
             
             if response.status_code != 200:
                 return {
                     "status": "error",
-                    "error": f"Revit MCP Server returned status {response.status_code}: {response.text}",
+                    "error": f"Revit MCP Server returned status {response.status_code}: {_response_excerpt(response)}",
                 }
             
             # Translate Revit response to MCP format
-            revit_response = response.json()
+            revit_response = _json_loads(response.content)
             return self.translate_revit_to_mcp(tool_name, revit_response)
         
         except Exception as e:
-            logger.exception(f"Error handling tool request: {str(e)}")
+            logger.exception("Error handling tool request: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -237,6 +487,8 @@ class RevitMcpToolHandler:
             logger.info("Stopping Revit MCP Server...")
             self.revit_server_process.terminate()
             self.revit_server_process.wait(timeout=5)
+        self.executor.shutdown(wait=False)
+        self.session.close()
         logger.info("Revit MCP Tool Handler shutdown complete")
 
 def main():
@@ -253,32 +505,78 @@ def main():
         handler.register_tools()
         
         # Start HTTP server to handle tool requests
-        from http.server import HTTPServer, BaseHTTPRequestHandler
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
         
         class MCP_ToolRequestHandler(BaseHTTPRequestHandler):
+            # Every response carries Content-Length, so connections can be kept alive
+            protocol_version = 'HTTP/1.1'
+            # Send small JSON responses immediately instead of waiting on Nagle's algorithm
+            disable_nagle_algorithm = True
+            
+            def _send_json(self, status_code, response_data):
+                body = _json_dumps(response_data)
+                self.send_response(status_code)
+                self.send_header('Content-type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
             def do_POST(self):
-                content_length = int(self.headers['Content-Length'])
+                try:
+                    content_length = int(self.headers['Content-Length'])
+                    if content_length < 0:
+                        raise ValueError(content_length)
+                except (TypeError, ValueError):
+                    # The body can't be delimited, so the connection can't be reused either
+                    self.close_connection = True
+                    self._send_json(400, {"status": "error", "error": "Missing or invalid Content-Length"})
+                    return
+                
                 post_data = self.rfile.read(content_length)
-                request_data = json.loads(post_data.decode('utf-8'))
+                try:
+                    request_data = _json_loads(post_data)
+                except ValueError:
+                    self._send_json(400, {"status": "error", "error": "Request body is not valid JSON"})
+                    return
                 
                 # Extract tool name from path
                 tool_name = self.path.strip('/').split('/')[-1]
                 
-                # Handle the request
-                response_data = handler.handle_tool_request(tool_name, request_data)
+                # Handle the request on the bounded worker pool
+                response_data = handler.executor.submit(handler.handle_tool_request, tool_name, request_data).result()
                 
                 # Send response
+                self._send_json(200, response_data)
+            
+            def do_GET(self):
+                parts = self.path.strip('/').split('/')
+                body = handler.get_tool_schema(parts[-1]) if len(parts) == 2 and parts[0] == 'schemas' else None
+                if body is None:
+                    self.send_error(404, "Unknown tool schema")
+                    return
+                
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
                 self.end_headers()
-                self.wfile.write(json.dumps(response_data).encode('utf-8'))
+                self.wfile.write(body)
             
             def log_message(self, format, *args):
-                logger.info(f"HTTP: {self.address_string()} - {format % args}")
+                logger.info("HTTP: %s - " + format, self.address_string(), *args)
+        
+        class MCP_ToolHTTPServer(ThreadingHTTPServer):
+            allow_reuse_address = True
+            daemon_threads = True
+            
+            def server_bind(self):
+                # Let several handler processes share the port
+                if hasattr(socket, 'SO_REUSEPORT'):
+                    self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                super().server_bind()
         
-        # Start the HTTP server
-        server = HTTPServer(('0.0.0.0', TOOL_PORT), MCP_ToolRequestHandler)
-        logger.info(f"MCP Tool HTTP server started on port {TOOL_PORT}")
+        # Start the HTTP server (one thread per connection so slow Revit calls overlap)
+        server = MCP_ToolHTTPServer(('0.0.0.0', TOOL_PORT), MCP_ToolRequestHandler)
+        logger.info("MCP Tool HTTP server started on port %s", TOOL_PORT)
         
         try:
             server.serve_forever()
@@ -288,7 +586,7 @@ def main():
             server.server_close()
     
     except Exception as e:
-        logger.exception(f"Fatal error: {str(e)}")
+        logger.exception("Fatal error: %s", e)
         sys.exit(1)
     finally:
         handler.shutdown()